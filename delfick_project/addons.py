@@ -17,7 +17,7 @@ class addon_hook(object):
             msg = "Sorry, can't specify ``extras`` and ``post_register`` at the same time"
             raise ProgrammerError(msg)
         spec = sb.listof(sb.tuple_spec(sb.string_spec(), sb.listof(sb.string_spec())))
-        self.extras = spec.normalise(Meta({}, []), extras)
+        self.extras = spec.normalise(Meta.empty(), extras)
 
     def __call__(self, func):
         func.extras = self.extras
@@ -138,7 +138,7 @@ class AddonGetter(object):
         )
 
         return self.namespaces[namespace][1].normalise(
-            Meta({}, []),
+            Meta.empty(),
             {
                 "namespace": namespace,
                 "name": entry_point_name,
@@ -728,6 +728,9 @@ class integer_spec(Spec):
 
     def normalise_filled(self, meta, val):
         """Make sure it's an integer and convert into one if it's a string"""
+        if type(val) is int:
+            return val
+
         if not isinstance(val, bool) and (
             isinstance(val, int) or hasattr(val, "isdigit") and val.isdigit()
         ):
@@ -756,6 +759,9 @@ class float_spec(Spec):
 
     def normalise_filled(self, meta, val):
         """Make sure it's a float"""
+        if type(val) is float:
+            return val
+
         try:
             if not isinstance(val, bool):
                 return float(val)
@@ -784,7 +790,13 @@ class string_or_int_as_string_spec(Spec):
 
     def normalise_filled(self, meta, val):
         """Make sure it's a string or integer"""
-        if isinstance(val, bool) or (not isinstance(val, str) and not isinstance(val, int)):
+        typ = type(val)
+        if typ is str:
+            return val
+        elif typ is int:
+            return str(val)
+
+        if isinstance(val, bool) or not isinstance(val, (str, int)):
             raise BadSpecValue("Expected a string or integer", meta=meta, got=type(val))
         return str(val)
 
@@ -946,6 +958,9 @@ class or_spec(Spec):
     This will keep trying ``spec.normalise(meta, val)`` until it finds one that
     doesn't raise a ``BadSpec`` error.
 
+    The specs are always tried in the order they were given, so the result
+    doesn't depend on what was normalised before.
+
     If it can't find one, then it raises all the errors as a group.
     """
 
@@ -1125,7 +1140,8 @@ class dict_from_bool_spec(Spec):
 
     def normalise_filled(self, meta, val):
         """Proxy the spec"""
-        if isinstance(val, bool):
+        # bool can't be subclassed so an identity check is enough here
+        if type(val) is bool:
             val = self.dict_maker(meta, val)
         return self.spec.normalise(meta, val)
 
@@ -1183,32 +1199,34 @@ class formatted(Spec):
 
     def normalise_either(self, meta, val):
         """Format the value"""
-        options_opts = {}
-        if hasattr(meta.everything, "converters"):
-            options_opts["converters"] = meta.everything.converters
-        if hasattr(meta.everything, "dont_prefix"):
-            options_opts["dont_prefix"] = meta.everything.dont_prefix
-        options = meta.everything.__class__(**options_opts)
-        options.update(meta.key_names())
-        options.update(meta.everything)
-
         af = self.after_format
-        if af != NotSpecified:
-            af = self.after_format
-            if callable(af):
-                af = af()
+        has_after_format = af is not NotSpecified
+        if has_after_format and callable(af):
+            af = af()
 
         specd = self.spec.normalise(meta, val)
-        if not isinstance(specd, str) and af != NotSpecified:
+        if has_after_format and not isinstance(specd, str):
             return af.normalise(meta, specd)
 
+        # Only copy everything once we know there is something to format
+        everything = meta.everything
+
+        options_opts = {}
+        if hasattr(everything, "converters"):
+            options_opts["converters"] = everything.converters
+        if hasattr(everything, "dont_prefix"):
+            options_opts["dont_prefix"] = everything.dont_prefix
+        options = everything.__class__(**options_opts)
+        options.update(meta.key_names())
+        options.update(everything)
+
         chain = []
         path = meta.path
         if path:
             chain.append(path)
 
         formatted = self.formatter(options, specd, chain=chain).format()
-        if af != NotSpecified:
+        if has_after_format:
             formatted = af.normalise(meta, formatted)
 
         if self.has_expected_type:
@@ -1415,11 +1433,7 @@ class has(Spec):
         self.properties = properties
 
     def normalise_filled(self, meta, val):
-        missing = []
-        for prop in self.properties:
-            if not hasattr(val, prop):
-                missing.append(prop)
-
+        missing = [prop for prop in self.properties if not hasattr(val, prop)]
         if missing:
             raise BadSpecValue(
                 "Value is missing required properties",
@@ -1464,9 +1478,9 @@ class tuple_spec(Spec):
 
         result = []
         errors = []
-        for index, spec in enumerate(self.specs):
+        for index, (spec, item) in enumerate(zip(self.specs, val)):
             try:
-                result.append(spec.normalise(meta.indexed_at(index), val[index]))
+                result.append(spec.normalise(meta.indexed_at(index), item))
             except BadSpecValue as error:
                 errors.append(error)
 
@@ -50,11 +50,14 @@ class Converter(object):
 
     def matches(self, path):
         """Check to see if this converter should be used against this path"""
+        if not self.convert_path:
+            return self.convert_path
+
         if hasattr(path, "joined"):
             joined_path = path.joined()
         else:
-            joined_path = dot_joiner(path)
-        return self.convert_path and joined_path == self.convert_path_joined
+            joined_path = dot_joiner(path, type(path))
+        return joined_path == self.convert_path_joined
 
 
 class Converters(object):
@@ -128,8 +131,7 @@ class Converters(object):
 
     def done(self, path, value):
         """Mark a path as been replaced by the specified value"""
-        if path in self._waiting:
-            del self._waiting[path]
+        self._waiting.pop(path, None)
         self._converted[path] = value
 
     def started(self, path):
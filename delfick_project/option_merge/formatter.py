@@ -18,6 +18,7 @@ formatter that can format strings using a MergedOptions object.
     assert formatted == "a.b: 3, d: 5 and c=5 and d=${BLAH}"
 """
 
+import functools
 import string
 import types
 
@@ -27,10 +28,31 @@ from delfick_project.norms import Meta
 from .merge import MergedOptions
 
 
+# Objects of these types are returned as is rather than formatted into a string
+as_is_types = (
+    dict,
+    type(None),
+    types.LambdaType,
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+    types.BuiltinMethodType,
+)
+
+
 class BadOptionFormat(DelfickError):
     pass
 
 
+_formatter = string.Formatter()
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_format_string(format_string):
+    """The same templates get formatted over and over, so only parse them once"""
+    return tuple(_formatter.parse(format_string))
+
+
 class NoFormat(object):
     """Used to tell when to stop formatting a string"""
 
@@ -94,6 +116,10 @@ class MergedOptionStringFormatter(string.Formatter):
             format_spec in the passthrough_format_specs list
         """
 
+    def parse(self, format_string):
+        """Use the cached parse of this format_string"""
+        return parse_format_string(format_string)
+
     def get_string(self, key):
         """
         Get a string from all_options and complain if the key doesn't exist.
@@ -121,22 +147,12 @@ class MergedOptionStringFormatter(string.Formatter):
         if special:
             return special
         else:
-            is_dict = type(obj) is MergedOptions or isinstance(obj, dict)
-            is_a_mock = hasattr(obj, "mock_calls")
-            is_special_type = any(
-                isinstance(obj, typ)
-                for typ in (
-                    type(None),
-                    types.LambdaType,
-                    types.FunctionType,
-                    types.MethodType,
-                    types.BuiltinFunctionType,
-                    types.BuiltinMethodType,
-                )
-            )
-            is_formattable = getattr(obj, "_merged_options_formattable", False)
-
-            if is_dict or is_special_type or is_a_mock or is_formattable:
+            if (
+                type(obj) is MergedOptions
+                or isinstance(obj, as_is_types)
+                or hasattr(obj, "mock_calls")
+                or getattr(obj, "_merged_options_formattable", False)
+            ):
                 return obj
             else:
                 return super().format_field(obj, format_spec)
@@ -1,40 +1,25 @@
-import os
-import shutil
-import tempfile
-
 import pytest
 
 
-@pytest.fixture()
-def temp_file():
-    fle = None
-    try:
-        with tempfile.NamedTemporaryFile(delete=False) as fle:
-            filename = fle.name
-        yield filename
-    finally:
-        if fle and os.path.exists(fle.name):
-            os.remove(fle.name)
+@pytest.fixture(scope="session")
+def temp_file(tmp_path_factory):
+    filename = tmp_path_factory.mktemp("temp_file") / "file"
+    filename.touch()
+    return str(filename)
 
 
-@pytest.fixture()
-def removed_temp_file(temp_file):
-    os.remove(temp_file)
-    return temp_file
+@pytest.fixture(scope="session")
+def missing_file_path(tmp_path_factory):
+    # A path that is never created
+    return str(tmp_path_factory.mktemp("missing_file_path") / "file")
 
 
-@pytest.fixture()
-def temp_dir():
-    d = None
-    try:
-        d = tempfile.mkdtemp()
-        yield d
-    finally:
-        if d and os.path.exists(d):
-            shutil.rmtree(d)
+@pytest.fixture(scope="session")
+def temp_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("temp_dir"))
 
 
-@pytest.fixture()
-def removed_temp_dir(temp_dir):
-    shutil.rmtree(temp_dir)
-    return temp_dir
+@pytest.fixture(scope="session")
+def missing_dir_path(tmp_path_factory):
+    # A path that is never created
+    return str(tmp_path_factory.mktemp("missing_dir_path") / "dir")
@@ -1,5 +1,6 @@
 # coding: spec
 
+import re
 import uuid
 from unittest import mock
 
@@ -17,6 +18,11 @@ from delfick_project.norms import (
 )
 
 
+# Values that either_keys won't accept as the value or as a choice
+NOT_DICTS = (None, 0, 1, "", "a", [], [1], lambda: 1)
+NOT_LISTS = (None, sb.NotSpecified, 0, 1, "", "1", {}, {1: 1}, lambda: 1)
+
+
 @pytest.fixture()
 def meta():
     return Meta.empty()
@@ -30,8 +36,8 @@ describe "Validator":
         assert Validator().normalise(meta, sb.NotSpecified) is sb.NotSpecified
 
     it "uses validate if value is specified", meta:
-        val = mock.Mock(name="val")
-        result = mock.Mock(name="result")
+        val = mock.sentinel.val
+        result = mock.sentinel.result
         validate = mock.Mock(name="validate")
         validate.return_value = result
 
@@ -41,7 +47,7 @@ describe "Validator":
 
 describe "has_either":
     it "takes in choices":
-        choices = mock.Mock(name="choices")
+        choices = mock.sentinel.choices
         validator = va.has_either(choices)
         assert validator.choices is choices
 
@@ -113,15 +119,15 @@ describe "has_only_one_of":
 
 describe "either_keys":
     it "takes in choices as positional arguments":
-        choice1 = [mock.Mock(name="choice1")]
-        choice2 = [mock.Mock(name="choice2")]
+        choice1 = [mock.sentinel.choice1]
+        choice2 = [mock.sentinel.choice2]
         validator = va.either_keys(choice1, choice2)
         assert validator.choices == (choice1, choice2)
 
-    it "complains if the value is not a dictionary", meta:
-        for val in (None, 0, 1, "", "a", [], [1], lambda: 1):
-            with assertRaises(BadSpecValue, "Expected a dictionary"):
-                va.either_keys().normalise(meta, val)
+    @pytest.mark.parametrize("val", NOT_DICTS)
+    it "complains if the value is not a dictionary", meta, val:
+        with assertRaises(BadSpecValue, "Expected a dictionary"):
+            va.either_keys().normalise(meta, val)
 
     it "complains if any choice has a common key":
         with assertRaises(
@@ -129,10 +135,10 @@ describe "either_keys":
         ):
             va.either_keys(["one", "two"], ["two", "three"], ["three", "four"])
 
-    it "complains if any choice is not a list":
-        for val in (None, sb.NotSpecified, 0, 1, "", "1", {}, {1: 1}, lambda: 1):
-            with assertRaises(BadSpecDefinition, "Each choice must be a list", got=val):
-                va.either_keys(["one", "two"], val)
+    @pytest.mark.parametrize("val", NOT_LISTS)
+    it "complains if any choice is not a list", val:
+        with assertRaises(BadSpecDefinition, "Each choice must be a list", got=val):
+            va.either_keys(["one", "two"], val)
 
     it "complains if some of the keys in the group aren't in the val", meta:
         with assertRaises(
@@ -188,23 +194,16 @@ describe "either_keys":
     it "can successfully return the val if it perfectly associates with a group and no other", meta:
         val1 = {"three": 3, "four": 4}
         val2 = {"three": 3, "four": 4, "five": 5}
-        res1 = va.either_keys(["one", "two"], ["three", "four"]).normalise(meta, val1)
-        res2 = va.either_keys(["one", "two"], ["three", "four"]).normalise(meta, val2)
+        validator = va.either_keys(["one", "two"], ["three", "four"])
+        res1 = validator.normalise(meta, val1)
+        res2 = validator.normalise(meta, val2)
 
         assert res1 == val1
         assert res2 == val2
 
 describe "no_whitesapce":
     it "Sets up a whitespace regex":
-        fake_compile = mock.Mock(name="fake_compile")
-        compiled_regex = mock.Mock(name="compiled_regex")
-
-        with mock.patch("re.compile", fake_compile):
-            fake_compile.return_value = compiled_regex
-            validator = va.no_whitespace()
-            assert validator.regex is compiled_regex
-
-        fake_compile.assert_called_once_with(r"\s+")
+        assert va.no_whitespace().regex.pattern == r"\s+"
 
     it "has a regex that finds whitespace":
         validator = va.no_whitespace()
@@ -224,7 +223,7 @@ describe "no_whitesapce":
 
 describe "no_dots":
     it "takes in a reason":
-        reason = mock.Mock(name="reason")
+        reason = mock.sentinel.reason
         assert va.no_dots().reason is None
         assert va.no_dots(reason=reason).reason is reason
 
@@ -245,33 +244,13 @@ describe "no_dots":
                 va.no_dots().normalise(meta, val)
 
 describe "regexed":
-    it "takes in regexes which it will compile", meta:
-        regex1 = mock.Mock(name="regex1")
-        regex2 = mock.Mock(name="regex2")
-        regex3 = mock.Mock(name="regex3")
-        regex4 = mock.Mock(name="regex4")
-        compiled_regex1 = mock.Mock(name="compiled_regex1")
-        compiled_regex2 = mock.Mock(name="compiled_regex2")
-        compiled_regex3 = mock.Mock(name="compiled_regex3")
-        compiled_regex4 = mock.Mock(name="compiled_regex4")
-
-        matched = {
-            regex1: compiled_regex1,
-            regex2: compiled_regex2,
-            regex3: compiled_regex3,
-            regex4: compiled_regex4,
-        }
-
-        fake_compile = mock.Mock(name="compile")
-        fake_compile.side_effect = lambda reg: matched[reg]
-        with mock.patch("re.compile", fake_compile):
-            validator = va.regexed(regex1, regex2, regex3, regex4)
-            assert validator.regexes == [
-                (regex1, compiled_regex1),
-                (regex2, compiled_regex2),
-                (regex3, compiled_regex3),
-                (regex4, compiled_regex4),
-            ]
+    it "takes in regexes which it will compile":
+        validator = va.regexed("[a-z]+", "asdf", "a.+")
+        assert validator.regexes == [
+            ("[a-z]+", re.compile("[a-z]+")),
+            ("asdf", re.compile("asdf")),
+            ("a.+", re.compile("a.+")),
+        ]
 
     it "returns the value if it matches all the regexes", meta:
         assert va.regexed("[a-z]+", "asdf", "a.+").normalise(meta, "asdf") == "asdf"
@@ -289,27 +268,27 @@ describe "regexed":
 
 describe "deprecated_key":
     it "takes in key and a reason":
-        key = mock.Mock(name="key")
-        reason = mock.Mock(name="reason")
+        key = mock.sentinel.key
+        reason = mock.sentinel.reason
         dk = va.deprecated_key(key, reason)
         assert dk.key is key
         assert dk.reason is reason
 
     it "complains if the key is in the value", meta:
-        key = mock.Mock(name="key")
-        reason = mock.Mock(name="reason")
+        key = mock.sentinel.key
+        reason = mock.sentinel.reason
         with assertRaises(DeprecatedKey, key=key, reason=reason):
             va.deprecated_key(key, reason).normalise(meta, {key: 1})
 
     it "doesn't complain if the key is not in the value", meta:
-        key = mock.Mock(name="key")
-        reason = mock.Mock(name="reason")
+        key = mock.sentinel.key
+        reason = mock.sentinel.reason
         va.deprecated_key(key, reason).normalise(meta, {})
         assert True
 
     it "doesn't fail if the val is not iterable", meta:
-        key = mock.Mock(name="key")
-        reason = mock.Mock(name="reason")
+        key = mock.sentinel.key
+        reason = mock.sentinel.reason
         va.deprecated_key(key, reason).normalise(meta, None)
         assert True
 
@@ -2,31 +2,42 @@
 
 import json
 import os
-import shutil
-import tempfile
-from contextlib import contextmanager
 from getpass import getpass
 from unittest import mock
 
+import pytest
+
 from delfick_project.errors import DelfickError
 from delfick_project.errors_pytest import assertRaises
 from delfick_project.norms import Meta, sb
 from delfick_project.option_merge import Collector, MergedOptions
 
+
+class JsonCollector(Collector):
+    """A Collector that merges in json files as they are"""
+
+    def start_configuration(self):
+        return MergedOptions.using({})
+
+    def read_file(self, location):
+        with open(location) as fle:
+            return json.load(fle)
+
+    def add_configuration(self, configuration, collect_another_source, done, result, src):
+        configuration.update(result)
+
+
 describe "Collector":
 
-    @contextmanager
-    def fake_config(self, body="\n{}"):
-        root = None
-        try:
-            root = tempfile.mkdtemp()
-            config_file = os.path.join(root, "config.json")
-            with open(config_file, "w") as fle:
-                fle.write(body)
-            yield (root, config_file)
-        finally:
-            if root and os.path.exists(root):
-                shutil.rmtree(root)
+    @pytest.fixture()
+    def fake_config(self, tmp_path_factory):
+        def fake_config(body="\n{}"):
+            root = tmp_path_factory.mktemp("config")
+            config_file = root / "config.json"
+            config_file.write_text(body)
+            return str(root), str(config_file)
+
+        return fake_config
 
     describe "__init__":
         it "calls setup":
@@ -66,31 +77,20 @@ describe "Collector":
             spec2.normalise.assert_called_once_with(meta.at("two").at("three.four"), 2)
 
     describe "Cloning":
-        it "returns an instance that has rerun collect_configuration and prepare":
+        it "returns an instance that has rerun collect_configuration and prepare", fake_config:
             called = []
             original_args_dict = {"a": 1, "b": 2}
-            with self.fake_config() as (config_root, config_file):
+            config_root, config_file = fake_config()
 
-                class Col(Collector):
-                    def start_configuration(s):
-                        return MergedOptions.using({})
+            class Col(JsonCollector):
+                def alter_clone_args_dict(slf, nw_cllctr, nw_args_dict, new_args):
+                    nw_args_dict.update(new_args)
+                    called.append((1, nw_cllctr, nw_args_dict))
+                    return nw_args_dict
 
-                    def read_file(s, location):
-                        return json.load(open(location))
-
-                    def add_configuration(
-                        s, configuration, collect_another_source, done, result, src
-                    ):
-                        configuration.update(result)
-
-                    def alter_clone_args_dict(slf, nw_cllctr, nw_args_dict, new_args):
-                        nw_args_dict.update(new_args)
-                        called.append((1, nw_cllctr, nw_args_dict))
-                        return nw_args_dict
-
-                collector = Col()
-                collector.prepare(config_file, original_args_dict)
-                assert collector.configuration["args_dict"].as_dict() == original_args_dict
+            collector = Col()
+            collector.prepare(config_file, original_args_dict)
+            assert collector.configuration["args_dict"].as_dict() == original_args_dict
 
             class MockCollectorKls(Col):
                 def prepare(slf, config_file, new_args_dict):
@@ -107,91 +107,66 @@ describe "Collector":
             assert original_args_dict == {"a": 1, "b": 2}
 
     describe "prepare":
-        it "find_missing_config, configuration, does extra_prepare, activates converters and extra_prepare_after_activation":
+        it "find_missing_config, configuration, does extra_prepare, activates converters and extra_prepare_after_activation", fake_config:
             called = []
             args_dict = {}
-            with self.fake_config('{"one": 1}') as (config_root, config_file):
-
-                class Col(Collector):
-                    def start_configuration(s):
-                        return MergedOptions.using({})
-
-                    def read_file(s, location):
-                        return json.load(open(location))
-
-                    def add_configuration(
-                        s, configuration, collect_another_source, done, result, src
-                    ):
-                        configuration.update(result)
-
-                    def find_missing_config(slf, config):
-                        called.append((1, config))
-                        assert config.as_dict() == {
-                            "config_root": config_root,
-                            "one": 1,
-                            "getpass": getpass,
-                            "collector": slf,
-                            "args_dict": args_dict,
-                        }
-                        config.converters = mock.Mock(name="converters")
-
-                    def extra_prepare(slf, config, args_dict):
-                        called.append((2, config, args_dict))
-                        assert config.as_dict() == {
-                            "config_root": config_root,
-                            "one": 1,
-                            "collector": slf,
-                            "args_dict": args_dict,
-                            "getpass": getpass,
-                        }
-                        assert len(config.converters.mock_calls) == 0
-
-                    def extra_prepare_after_activation(slf, config, args_dict):
-                        called.append((3, config, args_dict))
-                        config.converters.activate.assert_called_once_with()
+            config_root, config_file = fake_config('{"one": 1}')
+
+            class Col(JsonCollector):
+                def find_missing_config(slf, config):
+                    called.append((1, config))
+                    assert config.as_dict() == {
+                        "config_root": config_root,
+                        "one": 1,
+                        "getpass": getpass,
+                        "collector": slf,
+                        "args_dict": args_dict,
+                    }
+                    config.converters = mock.Mock(name="converters")
+
+                def extra_prepare(slf, config, args_dict):
+                    called.append((2, config, args_dict))
+                    assert config.as_dict() == {
+                        "config_root": config_root,
+                        "one": 1,
+                        "collector": slf,
+                        "args_dict": args_dict,
+                        "getpass": getpass,
+                    }
+                    assert len(config.converters.mock_calls) == 0
+
+                def extra_prepare_after_activation(slf, config, args_dict):
+                    called.append((3, config, args_dict))
+                    config.converters.activate.assert_called_once_with()
+
+            collector = Col()
 
-                collector = Col()
-
-                assert called == []
-                collector.prepare(config_file, args_dict)
-                assert called == [
-                    (1, collector.configuration),
-                    (2, collector.configuration, args_dict),
-                    (3, collector.configuration, args_dict),
-                ]
+            assert called == []
+            collector.prepare(config_file, args_dict)
+            assert called == [
+                (1, collector.configuration),
+                (2, collector.configuration, args_dict),
+                (3, collector.configuration, args_dict),
+            ]
 
-        it "takes in extra files":
+        it "takes in extra files", fake_config:
             args_dict = {}
 
-            root = self.fake_config('{"one": 1}')
-            extra1 = self.fake_config('{"two": 2, "three": 3}')
+            config_root, config_file = fake_config('{"one": 1}')
+            _, e1 = fake_config('{"two": 2, "three": 3}')
             extra2 = {"three": 4, "five": 5}
 
-            with root as (config_root, config_file), extra1 as (_, e1):
-
-                class Col(Collector):
-                    def start_configuration(s):
-                        return MergedOptions.using({})
-
-                    def read_file(s, location):
-                        return json.load(open(location))
-
-                    def add_configuration(
-                        s, configuration, collect_another_source, done, result, src
-                    ):
-                        configuration.update(result)
-
-                collector = Col()
-                collector.prepare(config_file, args_dict, extra_files=[e1, extra2])
+            collector = JsonCollector()
+            collector.prepare(config_file, args_dict, extra_files=[e1, extra2])
 
-                expected = {"one": 1, "two": 2, "three": 4, "five": 5}
-                dct = collector.configuration.as_dict()
+            expected = {"one": 1, "two": 2, "three": 4, "five": 5}
+            dct = collector.configuration.as_dict()
 
-                for k, v in expected.items():
-                    assert dct[k] == v
+            for k, v in expected.items():
+                assert dct[k] == v
 
     describe "Collecting configuration":
-        it "uses start_configuration, read_file, home_dir_configuration, config_file, add_configuration and extra_configuration_collection":
+        it "uses start_configuration, read_file, home_dir_configuration, config_file, add_configuration and extra_configuration_collection", fake_config:
             called = []
             args_dict = {}
             configuration = MergedOptions.using({})
@@ -199,198 +174,198 @@ describe "Collector":
             result_home_dir = mock.MagicMock(name="result_home_dir")
             result_config_file = mock.MagicMock(name="result_config_file")
 
-            with self.fake_config() as (config_root, config_file):
-                home_dir = os.path.join(config_root, "home.json")
-                with open(home_dir, "w") as fle:
-                    fle.write("{}")
-                results = {config_file: result_config_file, home_dir: result_home_dir}
+            config_root, config_file = fake_config()
+            home_dir = os.path.join(config_root, "home.json")
+            with open(home_dir, "w") as fle:
+                fle.write("{}")
+            results = {config_file: result_config_file, home_dir: result_home_dir}
 
-                class Col(Collector):
-                    def start_configuration(slf):
-                        called.append((1,))
-                        return configuration
+            class Col(Collector):
+                def start_configuration(slf):
+                    called.append((1,))
+                    return configuration
 
-                    def read_file(slf, location):
-                        called.append((2, location))
-                        return results[location]
+                def read_file(slf, location):
+                    called.append((2, location))
+                    return results[location]
 
-                    def add_configuration(slf, config, collect_another_source, done, result, src):
-                        called.append((3, config, result, src))
+                def add_configuration(slf, config, collect_another_source, done, result, src):
+                    called.append((3, config, result, src))
 
-                    def home_dir_configuration_location(slf):
-                        return home_dir
+                def home_dir_configuration_location(slf):
+                    return home_dir
 
-                    def extra_configuration_collection(slf, config):
-                        assert [c[0] for c in called] == [1, 2, 3, 2, 3]
-                        called.append((4, config))
+                def extra_configuration_collection(slf, config):
+                    assert [c[0] for c in called] == [1, 2, 3, 2, 3]
+                    called.append((4, config))
 
-                collector = Col()
-                collector.collect_configuration(config_file, args_dict)
-                assert called == [
-                    (1,),
-                    (2, home_dir),
-                    (3, configuration, result_home_dir, home_dir),
-                    (2, config_file),
-                    (3, configuration, result_config_file, config_file),
-                    (4, configuration),
-                ]
-
-        it "ignores home_dir if it's not specified":
+            collector = Col()
+            collector.collect_configuration(config_file, args_dict)
+            assert called == [
+                (1,),
+                (2, home_dir),
+                (3, configuration, result_home_dir, home_dir),
+                (2, config_file),
+                (3, configuration, result_config_file, config_file),
+                (4, configuration),
+            ]
+
+        it "ignores home_dir if it's not specified", fake_config:
             called = []
             args_dict = {}
             configuration = MergedOptions.using({})
 
             result_config_file = mock.MagicMock(name="result_config_file")
 
-            with self.fake_config() as (config_root, config_file):
-                results = {config_file: result_config_file}
+            config_root, config_file = fake_config()
+            results = {config_file: result_config_file}
 
-                class Col(Collector):
-                    def start_configuration(slf):
-                        called.append((1,))
-                        return configuration
+            class Col(Collector):
+                def start_configuration(slf):
+                    called.append((1,))
+                    return configuration
 
-                    def read_file(slf, location):
-                        called.append((2, location))
-                        return results[location]
+                def read_file(slf, location):
+                    called.append((2, location))
+                    return results[location]
 
-                    def add_configuration(slf, config, collect_another_source, done, result, src):
-                        called.append((3, config, result, src))
+                def add_configuration(slf, config, collect_another_source, done, result, src):
+                    called.append((3, config, result, src))
 
-                    def extra_configuration_collection(slf, config):
-                        assert [c[0] for c in called] == [1, 2, 3]
-                        called.append((4, config))
+                def extra_configuration_collection(slf, config):
+                    assert [c[0] for c in called] == [1, 2, 3]
+                    called.append((4, config))
 
-                collector = Col()
-                collector.collect_configuration(config_file, args_dict)
-                assert called == [
-                    (1,),
-                    (2, config_file),
-                    (3, configuration, result_config_file, config_file),
-                    (4, configuration),
-                ]
-
-        it "gives a function for adding more sources to add_configuration":
+            collector = Col()
+            collector.collect_configuration(config_file, args_dict)
+            assert called == [
+                (1,),
+                (2, config_file),
+                (3, configuration, result_config_file, config_file),
+                (4, configuration),
+            ]
+
+        it "gives a function for adding more sources to add_configuration", fake_config:
             called = []
             args_dict = {}
             configuration = MergedOptions.using({})
 
-            with self.fake_config() as (config_root, config_file):
-                another_loc = os.path.join(config_root, "another.json")
-                with open(another_loc, "w") as fle:
-                    fle.write("{}")
-
-                other_loc = os.path.join(config_root, "other.json")
-                with open(other_loc, "w") as fle:
-                    fle.write("{}")
-
-                results = {
-                    config_file: {"extra": other_loc},
-                    other_loc: {"nested": another_loc},
-                    another_loc: {"stuff": "a"},
-                }
-
-                class Col(Collector):
-                    def start_configuration(slf):
-                        called.append((1,))
-                        return configuration
-
-                    def read_file(slf, location):
-                        called.append((2, location))
-                        return results[location]
-
-                    def add_configuration(slf, config, collect_another_source, done, result, src):
-                        if "extra" in result:
-                            collect_another_source(result["extra"])
-                        if "nested" in result:
-                            collect_another_source(
-                                result["nested"], prefix=["once", "twice"], extra={"a": "b"}
-                            )
-                        called.append((3, config, result, src))
-
-                    def extra_configuration_collection(slf, config):
-                        assert [c[0] for c in called] == [1, 2, 2, 2, 3, 3, 3]
-                        called.append((4, config))
+            config_root, config_file = fake_config()
+            another_loc = os.path.join(config_root, "another.json")
+            with open(another_loc, "w") as fle:
+                fle.write("{}")
 
-                collector = Col()
-                collector.collect_configuration(config_file, args_dict)
-                assert called == [
-                    (1,),
-                    (2, config_file),
-                    (2, other_loc),
-                    (2, another_loc),
-                    (
-                        3,
-                        configuration,
-                        {"once": {"twice": {"stuff": "a", "a": "b", "config_root": config_root}}},
-                        another_loc,
-                    ),
-                    (
-                        3,
-                        configuration,
-                        {"nested": another_loc, "config_root": config_root},
-                        other_loc,
-                    ),
-                    (
-                        3,
-                        configuration,
-                        {"extra": other_loc, "config_root": config_root},
-                        config_file,
-                    ),
-                    (4, configuration),
-                ]
-
-        it "Can't create a circular loop using collect_another_source":
+            other_loc = os.path.join(config_root, "other.json")
+            with open(other_loc, "w") as fle:
+                fle.write("{}")
+
+            results = {
+                config_file: {"extra": other_loc},
+                other_loc: {"nested": another_loc},
+                another_loc: {"stuff": "a"},
+            }
+
+            class Col(Collector):
+                def start_configuration(slf):
+                    called.append((1,))
+                    return configuration
+
+                def read_file(slf, location):
+                    called.append((2, location))
+                    return results[location]
+
+                def add_configuration(slf, config, collect_another_source, done, result, src):
+                    if "extra" in result:
+                        collect_another_source(result["extra"])
+                    if "nested" in result:
+                        collect_another_source(
+                            result["nested"], prefix=["once", "twice"], extra={"a": "b"}
+                        )
+                    called.append((3, config, result, src))
+
+                def extra_configuration_collection(slf, config):
+                    assert [c[0] for c in called] == [1, 2, 2, 2, 3, 3, 3]
+                    called.append((4, config))
+
+            collector = Col()
+            collector.collect_configuration(config_file, args_dict)
+            assert called == [
+                (1,),
+                (2, config_file),
+                (2, other_loc),
+                (2, another_loc),
+                (
+                    3,
+                    configuration,
+                    {"once": {"twice": {"stuff": "a", "a": "b", "config_root": config_root}}},
+                    another_loc,
+                ),
+                (
+                    3,
+                    configuration,
+                    {"nested": another_loc, "config_root": config_root},
+                    other_loc,
+                ),
+                (
+                    3,
+                    configuration,
+                    {"extra": other_loc, "config_root": config_root},
+                    config_file,
+                ),
+                (4, configuration),
+            ]
+
+        it "Can't create a circular loop using collect_another_source", fake_config:
             called = []
             args_dict = {}
             configuration = MergedOptions.using({})
 
-            with self.fake_config() as (config_root, config_file):
-                other_loc = os.path.join(config_root, "other.json")
-                with open(other_loc, "w") as fle:
-                    fle.write("{}")
-                results = {config_file: {"extra": other_loc}, other_loc: {"extra": config_file}}
+            config_root, config_file = fake_config()
+            other_loc = os.path.join(config_root, "other.json")
+            with open(other_loc, "w") as fle:
+                fle.write("{}")
+            results = {config_file: {"extra": other_loc}, other_loc: {"extra": config_file}}
 
-                class Col(Collector):
-                    def start_configuration(slf):
-                        called.append((1,))
-                        return configuration
+            class Col(Collector):
+                def start_configuration(slf):
+                    called.append((1,))
+                    return configuration
 
-                    def read_file(slf, location):
-                        called.append((2, location))
-                        return results[location]
+                def read_file(slf, location):
+                    called.append((2, location))
+                    return results[location]
 
-                    def add_configuration(slf, config, collect_another_source, done, result, src):
-                        assert result["config_root"] == config_root
-                        collect_another_source(result["extra"])
-                        called.append((3, config, result, src))
+                def add_configuration(slf, config, collect_another_source, done, result, src):
+                    assert result["config_root"] == config_root
+                    collect_another_source(result["extra"])
+                    called.append((3, config, result, src))
 
-                    def extra_configuration_collection(slf, config):
-                        assert [c[0] for c in called] == [1, 2, 2, 3, 3]
-                        called.append((4, config))
+                def extra_configuration_collection(slf, config):
+                    assert [c[0] for c in called] == [1, 2, 2, 3, 3]
+                    called.append((4, config))
 
-                collector = Col()
-                collector.collect_configuration(config_file, args_dict)
-                assert called == [
-                    (1,),
-                    (2, config_file),
-                    (2, other_loc),
-                    (
-                        3,
-                        configuration,
-                        {"extra": config_file, "config_root": config_root},
-                        other_loc,
-                    ),
-                    (
-                        3,
-                        configuration,
-                        {"extra": other_loc, "config_root": config_root},
-                        config_file,
-                    ),
-                    (4, configuration),
-                ]
-
-        it "collects errors from reading files and raises a mother exception":
+            collector = Col()
+            collector.collect_configuration(config_file, args_dict)
+            assert called == [
+                (1,),
+                (2, config_file),
+                (2, other_loc),
+                (
+                    3,
+                    configuration,
+                    {"extra": config_file, "config_root": config_root},
+                    other_loc,
+                ),
+                (
+                    3,
+                    configuration,
+                    {"extra": other_loc, "config_root": config_root},
+                    config_file,
+                ),
+                (4, configuration),
+            ]
+
+        it "collects errors from reading files and raises a mother exception", fake_config:
 
             class BadJson(DelfickError):
                 pass
@@ -400,37 +375,37 @@ describe "Collector":
 
             called = []
             args_dict = {}
-            with self.fake_config() as (config_root, config_file):
-                home_dir = os.path.join(config_root, "home.json")
-                with open(home_dir, "w") as fle:
-                    fle.write("{}")
-
-                class Col(Collector):
-                    BadFileErrorKls = BadJson
-                    BadConfigurationErrorKls = BadConfiguration
-
-                    def start_configuration(slf):
-                        called.append(0)
-                        return MergedOptions.using({})
-
-                    def read_file(slf, location):
-                        called.append((1, location))
-                        raise BadJson(location=location)
-
-                    def add_configuration(slf, *args, **kwargs):
-                        assert False, "This shouldn't get called"
-
-                    def extra_configuration_collection(slf, config):
-                        called.append(2)
-
-                    def home_dir_configuration_location(slf):
-                        return home_dir
-
-                with assertRaises(
-                    BadConfiguration,
-                    "Some of the configuration was broken",
-                    _errors=[BadJson(location=home_dir), BadJson(location=config_file)],
-                ):
-                    collector = Col()
-                    collector.collect_configuration(config_file, args_dict)
-                assert called == [0, (1, home_dir), (1, config_file), 2]
+            config_root, config_file = fake_config()
+            home_dir = os.path.join(config_root, "home.json")
+            with open(home_dir, "w") as fle:
+                fle.write("{}")
+
+            class Col(Collector):
+                BadFileErrorKls = BadJson
+                BadConfigurationErrorKls = BadConfiguration
+
+                def start_configuration(slf):
+                    called.append(0)
+                    return MergedOptions.using({})
+
+                def read_file(slf, location):
+                    called.append((1, location))
+                    raise BadJson(location=location)
+
+                def add_configuration(slf, *args, **kwargs):
+                    assert False, "This shouldn't get called"
+
+                def extra_configuration_collection(slf, config):
+                    called.append(2)
+
+                def home_dir_configuration_location(slf):
+                    return home_dir
+
+            with assertRaises(
+                BadConfiguration,
+                "Some of the configuration was broken",
+                _errors=[BadJson(location=home_dir), BadJson(location=config_file)],
+            ):
+                collector = Col()
+                collector.collect_configuration(config_file, args_dict)
+            assert called == [0, (1, home_dir), (1, config_file), 2]
@@ -59,6 +59,12 @@ describe "Converter":
             assert Converter(None, ["a", "b", "c", "d"]).matches(["a", "b", "c", "d"])
             assert not Converter(None, ["a", "c", "d"]).matches(["a", "b", "c", "d"])
 
+        it "doesn't join the path if there is no convert_path":
+            path = mock.NonCallableMock(name="path", spec=["joined"])
+            assert not Converter(None).matches(path)
+            assert not Converter(None, []).matches(path)
+            path.joined.assert_not_called()
+
 describe "Converters":
     it "defaults activated to False":
         assert Converters().activated is False
@@ -116,6 +122,16 @@ describe "Converters":
             converters.done(Path("1.2.3.4"), val)
             assert converters._converted == {Path("1.2.3.4"): val}
 
+        it "stops waiting for that path":
+            val = mock.Mock(name="val")
+            converters = Converters()
+            converters.started(Path("1.2.3.4"))
+            assert converters.waiting(Path("1.2.3.4"))
+
+            converters.done(Path("1.2.3.4"), val)
+            assert not converters.waiting(Path("1.2.3.4"))
+            assert converters._waiting == {}
+
     describe "Determining state of a path":
         it "says no if not activated":
             converters = Converters()
@@ -203,6 +203,18 @@ describe "MergedOptionStringFormatter":
 
             special_format_field.assert_called_once_with(obj, format_spec)
 
+    describe "parse":
+        it "parses the same as string.Formatter", ms:
+            formatter = MergedOptionStringFormatter(ms.all_options, ms.value)
+            for format_string in ("", "stuff", "{a.b}", "a {b:env} and {c!r} {{d}}"):
+                assert list(formatter.parse(format_string)) == list(
+                    string.Formatter().parse(format_string)
+                )
+
+        it "only parses each format string once", ms:
+            formatter = MergedOptionStringFormatter(ms.all_options, ms.value)
+            assert formatter.parse("{one} {two}") is formatter.parse("{one} {two}")
+
     describe "_vformat":
         it "returns the object if only formatting one item":
             blah = type("blah", (dict,), {})()
@@ -73,6 +73,11 @@ class App:
     def tests(self, bin_dir, args):
         if "-q" not in args:
             args = ["-q", *args]
+
+        # NORMS_FAST=1 turns off .pytest_cache, which also means --lf and friends won't work
+        if os.environ.get("NORMS_FAST") == "1":
+            args = ["-p", "no:cacheprovider", *args]
+
         run(bin_dir / "pytest", *args, _env={"NOSE_OF_YETI_BLACK_COMPAT": "false"})
 
     @command